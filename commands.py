@@ -73,7 +73,7 @@ from runcommands.util import (
 @command(creates=(".venv", "poetry.lock"), sources="pyproject.toml")
 def install():
     """Create virtualenv & install dependencies by running `poetry install`."""
-    local("poetry install")
+    local(("poetry", "install"))
     pathlib.Path(".venv").touch()
     pathlib.Path("poetry.lock").touch()
 
@@ -81,7 +81,7 @@ def install():
 @command
 def update():
     """Update dependencies by running `poetry update`."""
-    local("poetry update")
+    local(("poetry", "update"))
 
 
 @command
@@ -210,7 +210,7 @@ def tox(
     clean: "Remove tox directory first" = False,
 ):
     if clean:
-        local("rm -rf .tox", echo=True)
+        local(("rm", "-rf", ".tox"), echo=True)
     local(
         (
             "tox",
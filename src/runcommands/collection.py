@@ -1,4 +1,6 @@
-from typing import MutableMapping
+from collections.abc import MutableMapping
+
+from cached_property import cached_property
 
 from .command import Command
 
@@ -37,6 +39,32 @@ class Collection(MutableMapping):
             command = self[name]
             command.default_args = default_args.get(command.name) or {}
 
+    def configure(self, default_args=None, **attrs):
+        """Set default args and attributes on commands in one pass.
+
+        This is equivalent to calling :meth:`set_attrs` with ``attrs``
+        and then :meth:`set_default_args` with ``default_args`` but
+        only iterates over the commands once.
+
+        """
+        default_args = default_args or {}
+        attrs = tuple(attrs.items())
+        for name, command in self.commands.items():
+            for attr_name, value in attrs:
+                setattr(command, attr_name, value)
+            if name in default_args:
+                command.default_args = default_args[name] or {}
+
+    @cached_property
+    def sorted_names(self):
+        """Names of commands in collection, sorted.
+
+        This is reset when commands are added or removed via item
+        assignment or deletion.
+
+        """
+        return tuple(sorted(self.commands))
+
     def __getitem__(self, name):
         commands = self.commands
         if name in commands:
@@ -46,9 +74,19 @@ class Collection(MutableMapping):
 
     def __setitem__(self, name, command):
         self.commands[name] = command
+        self.__dict__.pop("sorted_names", None)
 
     def __delitem__(self, name):
         del self.commands[name]
+        self.__dict__.pop("sorted_names", None)
+
+    def __contains__(self, name):
+        # NOTE: This is equivalent to the default implementation, which
+        #       calls __getitem__ and catches KeyError, but avoids the
+        #       cost of raising an exception for every non-command arg
+        #       when partitioning argv.
+        commands = self.commands
+        return name in commands or Command.normalize_name(name) in commands
 
     def __iter__(self):
         return iter(self.commands)
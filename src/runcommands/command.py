@@ -5,18 +5,16 @@ import signal
 import sys
 import time
 from collections import OrderedDict
+from collections.abc import Mapping
 from configparser import ConfigParser, ExtendedInterpolation
 from pathlib import Path
-from typing import Mapping
 
 from cached_property import cached_property
 
-import toml
-
 from .args import POSITIONAL_PLACEHOLDER, Arg, ArgConfig, HelpArg, Parameter
 from .exc import CommandError, RunAborted, RunCommandsError
 from .result import Result
-from .util import camel_to_underscore, is_type, printer, Data
+from .util import camel_to_underscore, is_type, load_toml, printer, Data
 
 
 __all__ = ["command", "subcommand", "Command"]
@@ -334,7 +332,7 @@ class Command:
 
         if pyproject_file not in _cache:
             if pyproject_file.is_file():
-                all_config = toml.load(pyproject_file)
+                all_config = load_toml(pyproject_file)
             else:
                 all_config = None
             _cache[pyproject_file] = all_config
@@ -359,19 +357,18 @@ class Command:
         if setup_file not in _cache:
             if setup_file.is_file():
                 parser = ConfigParser(interpolation=ExtendedInterpolation())
-                parser.read(setup_file)
-                sections = parser.sections()
+                parser.read(setup_file, encoding="utf-8")
             else:
-                sections = None
-            _cache[setup_file] = sections
+                parser = None
+            _cache[setup_file] = parser
 
-        sections = _cache[setup_file]
+        parser = _cache[setup_file]
 
-        if sections is not None:
+        if parser is not None:
             candidates = [f"runcommands.{self.name}.args", f"{self.name}.args"]
             for candidate in candidates:
-                if candidate in sections:
-                    args = sections[candidate]
+                if parser.has_section(candidate):
+                    args = parser[candidate]
                     return self.convert_config_file_args(setup_file, args)
 
         return {}
@@ -1066,18 +1063,19 @@ class Command:
 
     def find_arg(self, name):
         """Find arg by normalized arg name or parameter name."""
+        args = self.args
+        if name in args:
+            return args[name]
         name = self.normalize_name(name)
-        return self.args.get(name)
+        return args.get(name)
 
     def find_parameter(self, name):
         """Find parameter by name or normalized arg name."""
-        param = self.parameters.get(name)
-        if param is None:
-            name = self.normalize_name(name)
-            arg = self.args.get(name)
-            if arg is not None and not isinstance(arg, HelpArg):
-                param = arg.parameter
-        return param
+        parameter_map = self.parameter_map
+        if name in parameter_map:
+            return parameter_map[name]
+        name = self.normalize_name(name)
+        return parameter_map.get(name)
 
     def get_arg_config(self, param):
         annotation = param.annotation
@@ -1147,6 +1145,20 @@ class Command:
             parameters[name] = Parameter(param)
         return parameters
 
+    @cached_property
+    def parameter_map(self):
+        """Map parameter names *and* normalized arg names to parameters.
+
+        This is used by :meth:`find_parameter` so that finding a
+        parameter is (usually) a single dict lookup.
+
+        """
+        parameter_map = dict(self.parameters)
+        for name, arg in self.args.items():
+            if name not in parameter_map and not isinstance(arg, HelpArg):
+                parameter_map[name] = arg.parameter
+        return parameter_map
+
     @cached_property
     def has_kwargs(self):
         return any(p.kind is p.VAR_KEYWORD for p in self.parameters.values())
@@ -1348,6 +1360,13 @@ class Command:
                 option_map[option] = arg
         return option_map
 
+    @cached_property
+    def sorted_options(self):
+        """All command-line options, including inverse options, sorted."""
+        return tuple(
+            sorted(option for arg in self.args.values() for option in arg.all_options)
+        )
+
     @property
     def help(self):
         help_ = self.arg_parser.format_help()
@@ -26,19 +26,11 @@ def git_version(
         ``--show`` flag.
 
     """
-    result = local(
-        ["git", "rev-parse", "--is-inside-work-tree"],
-        stdout="hide",
-        stderr="hide",
-        echo=False,
-        raise_on_error=False,
-    )
-
-    if not result:
-        # Not a git directory
-        return None
-
     # Return a tag if possible
+    #
+    # NOTE: There's no separate check to see if we're in a git work
+    #       tree since this and the fallback below both fail when we're
+    #       not, which saves spawning an extra git process.
     result = local(
         ["git", "describe", "--exact-match"],
         stdout="capture",
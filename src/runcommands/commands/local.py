@@ -1,6 +1,7 @@
 import os
-import shlex
+import re
 import subprocess
+from functools import lru_cache
 
 from ..args import arg
 from ..command import command
@@ -8,6 +9,47 @@ from ..result import Result
 from ..util import abs_path, flatten_args, printer, StreamOptions
 
 
+# Strings made up entirely of these characters can be split on
+# whitespace and exec'd directly instead of going through /bin/sh. This
+# mirrors the set of characters :func:`shlex.quote` considers safe.
+_simple_command_re = re.compile(r"[\w@%+=:,./ \t-]*")
+
+# Shell builtins that have no standalone executable equivalent; commands
+# starting with one of these always have to be run via the shell.
+_shell_only_builtins = frozenset(
+    (
+        ".",
+        "alias",
+        "cd",
+        "command",
+        "eval",
+        "exec",
+        "exit",
+        "export",
+        "hash",
+        "read",
+        "readonly",
+        "set",
+        "shift",
+        "source",
+        "trap",
+        "type",
+        "ulimit",
+        "umask",
+        "unalias",
+        "unset",
+        "wait",
+    )
+)
+
+# Buffer size for the file objects Popen wraps around its pipes. This
+# only matters when those file objects are read from directly, as when
+# the caller reads a background process's output; subprocess.run() and
+# communicate() read from the pipes in their own chunk sizes, so
+# foreground output capture isn't affected.
+_pipe_buffer_size = 64 * 1024
+
+
 @command
 def local(
     args: arg(container=list),
@@ -41,8 +83,12 @@ def local(
             ``environ`` to the subprocess.
         paths (list): A list of additional paths.
         shell (bool): Run as a shell command? The default is to run in
-            shell mode if ``args`` is a string. This flag can be used to
-            force a list of args to be run as a shell command too.
+            shell mode if ``args`` is a string that contains shell
+            syntax (quotes, variables, redirections, globs, etc) or
+            starts with a shell builtin; simple string commands like
+            ``"git log -1"`` are split and run directly. This flag can
+            be used to force a string or a list of args to be run as
+            a shell command.
         stdout (StreamOptions): What to do with stdout (capture, hide,
             or show).
         stderr (StreamOptions): Same as ``stdout``.
@@ -61,71 +107,186 @@ def local(
             ``raise_on_error`` is set).
 
     """
+    shell_command = None
+
     if isinstance(args, str):
+        display_str = args
         if shell is None:
-            shell = True
+            shell = not _is_simple_command(args)
+            if not shell:
+                shell_command = args
+                args = args.split()
     else:
+        display_str = None
         args = flatten_args(args, join=shell)
 
     if cd:
         cd = abs_path(cd)
-        cd_passed = True
+
+    if dry_run:
+        # No subprocess will be run, so there's no need for its env.
+        subprocess_env = None
     else:
-        cd_passed = False
+        subprocess_env = _get_subprocess_env(environ, replace_env, paths)
+
+    run_kwargs = {
+        "cwd": cd,
+        "env": subprocess_env,
+        "background": background,
+        "stdout": stdout,
+        "stderr": stderr,
+        "raise_on_error": raise_on_error,
+        "dry_run": dry_run,
+        "display_str": display_str,
+    }
+
+    try:
+        return _run_subprocess(args, shell=shell, echo=echo, **run_kwargs)
+    except OSError:
+        if shell_command is None:
+            raise
+        # The simple command couldn't be exec'd directly (e.g., it
+        # doesn't exist or is a script without a shebang line), so run
+        # it via the shell instead, which is what would have happened
+        # before simple commands were run directly. This way, failures
+        # are reported via a Result with the shell's exit code (e.g.,
+        # 127 for a missing command) as usual. The command has already
+        # been echoed, if requested.
+        return _run_subprocess(shell_command, shell=True, **run_kwargs)
+
 
-    environ = {k: str(v) for k, v in (environ or {}).items()}
+def _get_subprocess_env(environ, replace_env, paths):
+    """Get environment for subprocess run via :func:`local`.
+
+    Returns ``None`` when nothing needs to be added to the current
+    environment so the subprocess will simply inherit it.
+
+    """
+    if not environ:
+        environ = {}
+    elif not all(type(v) is str for v in environ.values()):
+        environ = {k: str(v) for k, v in environ.items()}
 
     if replace_env:
         subprocess_env = environ.copy()
-    else:
+    elif environ or paths:
         subprocess_env = os.environ.copy()
-        if environ:
-            subprocess_env.update(environ)
+        subprocess_env.update(environ)
+    else:
+        # Nothing to add, so let the subprocess inherit the current
+        # environment rather than passing a copy of it.
+        subprocess_env = None
 
     if paths:
         paths = [paths] if isinstance(paths, str) else paths
-        paths = [abs_path(p) for p in paths]
+        path_parts = [abs_path(p) for p in paths]
         current_path = subprocess_env.get("PATH")
         if current_path:
-            paths.append(current_path)
-        path = ":".join(paths)
-        subprocess_env["PATH"] = path
+            path_parts.append(current_path)
+        subprocess_env["PATH"] = os.pathsep.join(path_parts)
 
-    if stdout:
-        stdout = StreamOptions[stdout] if isinstance(stdout, str) else stdout
-        stdout = stdout.option
+    return subprocess_env
 
-    if stderr:
-        stderr = StreamOptions[stderr] if isinstance(stderr, str) else stderr
-        stderr = stderr.option
 
-    kwargs = {
-        "cwd": cd,
-        "env": subprocess_env,
-        "shell": shell,
-        "stdout": stdout,
-        "stderr": stderr,
-        "universal_newlines": True,
-    }
+def _run_subprocess(
+    args,
+    *,
+    cwd=None,
+    env=None,
+    shell=False,
+    background=False,
+    stdout=None,
+    stderr=None,
+    echo=False,
+    raise_on_error=True,
+    dry_run=False,
+    display_str=None,
+):
+    """Run a subprocess; this is the core of :func:`local`.
+
+    Unlike :func:`local`, this does no normalization of its args: it
+    expects ``args`` to be a flat list of strings (or a string when
+    ``shell`` is set), ``cwd`` to be an absolute path, and ``env`` to
+    be a complete environment or ``None`` to inherit the current
+    environment. Other commands that build their own argv, like
+    :func:`remote` and :func:`sync`, can use this directly to skip
+    that work.
 
-    display_str = args if shell else " ".join(shlex.quote(a) for a in args)
+    """
+    if (echo or dry_run) and display_str is None:
+        if shell:
+            display_str = args
+        else:
+            import shlex
+
+            display_str = " ".join(shlex.quote(a) for a in args)
 
     if echo:
-        if cd_passed:
-            printer.echo(f"{cd}>", end=" ")
+        if cwd:
+            printer.echo(f"{cwd}>", end=" ")
         if not dry_run:
             printer.echo(display_str)
 
     if dry_run:
         printer.echo("[DRY RUN]", display_str)
-        result = Result(args, 0, None, None)
-    elif background:
+        return Result(args, 0, None, None)
+
+    if stdout:
+        stdout = _get_stream_option(stdout)
+
+    if stderr:
+        stderr = _get_stream_option(stderr)
+
+    kwargs = {
+        "cwd": cwd,
+        "env": env,
+        "shell": shell,
+        "stdout": stdout,
+        "stderr": stderr,
+        "bufsize": _pipe_buffer_size,
+        "text": True,
+        "encoding": "utf-8",
+        "errors": "replace",
+    }
+
+    if background:
         return subprocess.Popen(args, **kwargs)
-    else:
-        result = subprocess.run(args, **kwargs)
-        result = Result.from_subprocess_result(result)
+
+    result = subprocess.run(args, **kwargs)
+    result = Result.from_subprocess_result(result)
 
     if result.return_code and raise_on_error:
         raise result
 
     return result
+
+
+@lru_cache(maxsize=None)
+def _get_stream_option(stream):
+    """Map stream option name or member to subprocess stream arg.
+
+    Unknown names raise a ``KeyError``.
+
+    """
+    if isinstance(stream, str):
+        stream = StreamOptions[stream]
+    return stream.option
+
+
+def _is_simple_command(args):
+    """Can ``args`` be run directly without going through the shell?
+
+    This is the case when the command string contains no shell syntax
+    and doesn't start with a shell builtin.
+
+    """
+    if not _simple_command_re.fullmatch(args):
+        return False
+    words = args.split()
+    if not words:
+        return False
+    first_word = words[0]
+    if "=" in first_word:
+        # Environment variable assignment like `X=1 command`
+        return False
+    return first_word not in _shell_only_builtins
@@ -1,11 +1,15 @@
-import shlex
 import sys
 
 from ..args import arg
 from ..command import command
 from ..result import Result
 from ..util import flatten_args, isatty, StreamOptions
-from .local import local
+from .local import _run_subprocess
+
+
+# Used when multiplexing connections; ssh expands the ~ and % tokens.
+CONTROL_PATH = "~/.ssh/runcommands-%r@%h:%p"
+CONTROL_PERSIST = "60s"
 
 
 @command
@@ -20,6 +24,7 @@ def remote(
     cd=None,
     environ: arg(container=dict) = None,
     paths=(),
+    multiplex=False,
     # Args passed through to local command:
     stdout: arg(type=StreamOptions) = None,
     stderr: arg(type=StreamOptions) = None,
@@ -55,6 +60,13 @@ def remote(
             host.
         paths (list): Additional paths to prepend to the remote
             ``$PATH``.
+        multiplex (bool): Share a single SSH connection between calls
+            to the same host using ``ControlMaster``. The first call
+            opens a master connection that's kept open in the
+            background for :data:`CONTROL_PERSIST` after its last use;
+            subsequent calls reuse it and skip connection setup and
+            authentication. The control socket is created at
+            :data:`CONTROL_PATH`.
         stdout: See :obj:`runcommands.commands.local`.
         stderr: See :obj:`runcommands.commands.local`.
         echo: See :obj:`runcommands.commands.local`.
@@ -65,13 +77,23 @@ def remote(
     if not isinstance(cmd, str):
         cmd = flatten_args(cmd, join=True)
 
-    ssh_options = ["-q"]
+    args = ["ssh", "-q"]
     if isatty(sys.stdin):
-        ssh_options.append("-t")
+        args.append("-t")
     if port is not None:
-        ssh_options.extend(("-p", port))
-
-    ssh_connection_str = f"{user}@{host}" if user else host
+        args.extend(("-p", str(port)))
+    if multiplex:
+        args.extend(
+            (
+                "-o",
+                "ControlMaster=auto",
+                "-o",
+                f"ControlPath={CONTROL_PATH}",
+                "-o",
+                f"ControlPersist={CONTROL_PERSIST}",
+            )
+        )
+    args.append(f"{user}@{host}" if user else host)
 
     remote_cmd = []
 
@@ -96,14 +118,14 @@ def remote(
 
     inner_cmd.append(cmd)
     inner_cmd = " &&\n    ".join(inner_cmd)
-    inner_cmd = f"\n    {inner_cmd}\n"
-    inner_cmd = shlex.quote(inner_cmd)
 
-    remote_cmd.append(inner_cmd)
-    remote_cmd = " ".join(remote_cmd)
+    # The inner command always needs quoting since it contains newlines,
+    # so quote it directly in the same way as shlex.quote() would.
+    inner_cmd = inner_cmd.replace("'", "'\"'\"'")
+    remote_cmd.append(f"'\n    {inner_cmd}\n'")
+    args.append(" ".join(remote_cmd))
 
-    args = ("ssh", ssh_options, ssh_connection_str, remote_cmd)
-    return local(
+    return _run_subprocess(
         args,
         stdout=stdout,
         stderr=stderr,
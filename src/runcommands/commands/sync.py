@@ -1,8 +1,8 @@
 from ..args import arg
 from ..command import command
 from ..result import Result
-from ..util import abs_path, StreamOptions
-from .local import local
+from ..util import abs_path, flatten_args, StreamOptions
+from .local import _run_subprocess
 
 
 @command
@@ -22,6 +22,7 @@ def sync(
     quiet=True,
     pull=False,
     # Args passed through to local command:
+    background=False,
     stdout: arg(type=StreamOptions) = None,
     stderr: arg(type=StreamOptions) = None,
     echo=False,
@@ -33,37 +34,60 @@ def sync(
     ``destination``. To pull from a remote ``source`` to a local
     ``destination`` instead, pass ``pull=True``.
 
+    To sync to multiple hosts concurrently, pass ``background=True``.
+    The ``rsync`` process will be started in the background and the
+    corresponding :class:`subprocess.Popen` object will be returned
+    immediately (see :obj:`runcommands.commands.local`)::
+
+        procs = [sync(source, destination, host, background=True) for host in hosts]
+        return_codes = [proc.wait() for proc in procs]
+
     """
     source = abs_path(source, keep_slash=True)
     destination = abs_path(destination, keep_slash=True)
     connection_str = f"{user}@{host}" if user else host
     push = not pull
 
+    args = ["rsync"]
+
     if sudo:
-        rsync_path = ("--rsync-path", "sudo rsync")
+        args.extend(("--rsync-path", "sudo rsync"))
     elif run_as:
-        rsync_path = ("--rsync-path", f"sudo -u {run_as} rsync")
-    else:
-        rsync_path = None
+        args.extend(("--rsync-path", f"sudo -u {run_as} rsync"))
+
+    # Options are wrapped in a list so that a single option passed as
+    # a string is kept whole. Empty and nested options are handled as
+    # in local().
+    args.extend(flatten_args([options]))
+
+    if mode:
+        args.extend(("--chmod", mode))
+
+    for exclude in excludes:
+        args.extend(("--exclude", exclude))
+
+    if exclude_from:
+        args.extend(("--exclude-from", exclude_from))
+
+    if delete:
+        args.append("--delete")
+
+    if dry_run:
+        args.append("--dry-run")
+
+    if quiet:
+        args.append("--quiet")
 
     if push:
-        destination = f"{connection_str}:{destination}"
+        args.extend((source, f"{connection_str}:{destination}"))
     else:
-        source = f"{connection_str}:{source}"
-
-    args = (
-        "rsync",
-        rsync_path,
-        options,
-        ("--chmod", mode) if mode else None,
-        tuple(("--exclude", exclude) for exclude in excludes),
-        ("--exclude-from", exclude_from) if exclude_from else None,
-        "--delete" if delete else None,
-        "--dry-run" if dry_run else None,
-        "--quiet" if quiet else None,
-        source,
-        destination,
-    )
-    return local(
-        args, stdout=stdout, stderr=stderr, echo=echo, raise_on_error=raise_on_error
+        args.extend((f"{connection_str}:{source}", destination))
+
+    return _run_subprocess(
+        args,
+        background=background,
+        stdout=stdout,
+        stderr=stderr,
+        echo=echo,
+        raise_on_error=raise_on_error,
     )
@@ -1,13 +1,20 @@
 import glob
+import hashlib
 import importlib
 import os
+import pickle
 import shlex
-from contextlib import redirect_stderr
+import sys
+from bisect import bisect_left
+from collections import namedtuple
+from itertools import islice, takewhile
 
+from .. import __version__
 from ..args import arg
 from ..collection import Collection
 from ..command import command
 from ..run import run
+from ..util import abs_path, module_from_path
 
 
 @command
@@ -29,21 +36,16 @@ def complete(
         shell: Name of shell
 
     """
-    position = int(position)
-    tokens = shlex.split(command_line[:position])
+    tokens = split_command_line(command_line, position)
     all_argv, run_argv, command_argv = run.partition_argv(tokens[1:])
-
-    with open(os.devnull, "w") as devnull_fp:
-        with redirect_stderr(devnull_fp):
-            run_args = run.parse_args(run_argv)
+    commands_module = run.get_commands_module_option(run_argv)
 
     try:
-        module = run.find_commands_module(run_args.get("commands_module"))
-        base_collection = Collection.load_from_module(module)
+        base_collection = load_collection(commands_module)
     except Exception:
         base_collection = {}
 
-    return _complete(run, base_collection, command_line, current_token, position, shell)
+    return _complete(run, base_collection, tokens, current_token, shell)
 
 
 @command
@@ -71,22 +73,131 @@ def complete_base_command(
     module = importlib.import_module(module_name)
     base_command = getattr(module, base_command_name)
     base_collection = {c.base_name: c for c in base_command.subcommands}
-    return _complete(
-        base_command, base_collection, command_line, current_token, position, shell
+    tokens = split_command_line(command_line, position)
+    return _complete(base_command, base_collection, tokens, current_token, shell)
+
+
+def split_command_line(command_line, position):
+    """Split command line up to ``position`` into tokens.
+
+    When there's no quoting or escaping, :meth:`str.split` gives the
+    same result as :func:`shlex.split`, so it's used instead.
+
+    """
+    command_line = command_line[: int(position)]
+    if '"' in command_line or "'" in command_line or "\\" in command_line:
+        return shlex.split(command_line)
+    return command_line.split()
+
+
+ArgInfo = namedtuple("ArgInfo", ("all_options", "takes_value", "choices"))
+
+
+class CommandInfo:
+
+    """Snapshot of the info about a command that's used for completion.
+
+    Unlike a :class:`Command`, this can be pickled since it doesn't
+    reference the command's implementation.
+
+    """
+
+    __slots__ = (
+        "name",
+        "base_name",
+        "description",
+        "is_subcommand",
+        "is_base_command",
+        "subcommands",
+        "args",
+        "option_map",
+        "sorted_options",
     )
 
+    def __init__(self, command):
+        arg_info = {}
+        for cmd_arg in command.args.values():
+            choices = cmd_arg.choices
+            if choices is not None:
+                choices = tuple(str(choice) for choice in choices)
+            arg_info[cmd_arg] = ArgInfo(
+                cmd_arg.all_options, cmd_arg.takes_value, choices
+            )
+        self.name = command.name
+        self.base_name = command.base_name
+        self.description = command.description
+        self.is_subcommand = command.is_subcommand
+        self.is_base_command = command.is_base_command
+        self.subcommands = [CommandInfo(sub) for sub in command.subcommands]
+        self.args = {name: arg_info[arg] for name, arg in command.args.items()}
+        self.option_map = {
+            option: arg_info[arg] for option, arg in command.option_map.items()
+        }
+        self.sorted_options = command.sorted_options
 
-def _complete(
-    base_command,
-    base_collection,
-    command_line,
-    current_token,
-    position,
-    shell,
-):
-    position = int(position)
-    tokens = shlex.split(command_line[:position])
 
+def load_collection(commands_module=None):
+    """Load commands for completion.
+
+    When the commands module is a file, the info needed for completion
+    is cached in ``$XDG_CACHE_HOME/runcommands/completion``. The cache
+    is keyed by the file's path, modification time, and size, so
+    subsequent completions don't have to import the commands module
+    until it changes.
+
+    .. note:: Changes in modules imported *by* the commands module
+        won't invalidate the cache; touch the commands module to force
+        a refresh.
+
+    """
+    if commands_module and not commands_module.endswith(".py"):
+        # Dotted module path; there's no single file to key a cache on.
+        module = run.find_commands_module(commands_module)
+        return Collection.load_from_module(module)
+
+    if commands_module:
+        path = abs_path(commands_module)
+    else:
+        path = run.find_commands_file()
+        if path is None:
+            return Collection({})
+
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size, __version__)
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    cache_dir = os.path.join(cache_dir, "runcommands", "completion")
+    cache_name = hashlib.sha1(path.encode("utf-8")).hexdigest()
+    cache_file = os.path.join(cache_dir, f"{cache_name}.pickle")
+
+    try:
+        with open(cache_file, "rb") as fp:
+            cached_key, info = pickle.load(fp)
+    except Exception:
+        pass
+    else:
+        if cached_key == key:
+            return Collection(info)
+
+    module = module_from_path("commands", path)
+    collection = Collection.load_from_module(module)
+    info = {name: CommandInfo(cmd) for name, cmd in collection.items()}
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_file = f"{cache_file}.{os.getpid()}"
+        with open(temp_file, "wb") as fp:
+            pickle.dump((key, info), fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+
+    # NOTE: The command info is returned on a cache miss too so that
+    #       completion works the same way whether or not the cache was
+    #       hit.
+    return Collection(info)
+
+
+def _complete(base_command, base_collection, tokens, current_token, shell):
     # XXX: This isn't quite correct because it will return the base
     #      command in case where it shouldn't. E.g., if `run xxx` is
     #      typed in, you'll get completions for `run` when you should
@@ -107,16 +218,10 @@ def _complete(
             if current_token not in found_command.option_map:
                 print_command_options(found_command, current_token)
         else:
-            print_commands(collection, shell)
+            print_commands(collection, shell, current_token)
             path = os.path.expanduser(current_token)
             path = os.path.expandvars(path)
-            paths = glob.glob("%s*" % path)
-            if paths:
-                for entry in paths:
-                    if os.path.isdir(entry):
-                        print("%s/" % entry)
-                    else:
-                        print(entry)
+            print_paths(path)
     else:
         # Completing option value. If a value isn't expected, show the
         # options for the current command and the list of commands
@@ -125,14 +230,13 @@ def _complete(
 
         if option and option.takes_value:
             if option.choices:
-                for choice in option.choices:
-                    print(choice)
+                print_lines(map(str, option.choices))
             else:
-                for entry in os.listdir():
-                    if os.path.isdir(entry):
-                        print("%s/" % entry)
-                    else:
-                        print(entry)
+                with os.scandir() as entries:
+                    print_lines(
+                        f"{entry.name}/" if entry.is_dir() else entry.name
+                        for entry in entries
+                    )
         else:
             print_command_options(found_command)
             print_commands(collection, shell)
@@ -144,18 +248,79 @@ def find_command(collection, tokens):
             return collection[token]
 
 
-def print_commands(collection, shell):
-    for name in collection:
-        cmd = collection[name]
-        description = cmd.description.splitlines()[0].strip() if cmd.description else ""
-        if shell in ("sh", "bash"):
-            print(name)
-        elif shell == "fish":
-            print(f"{name}\t{description}")
+def print_commands(collection, shell, prefix=""):
+    # NOTE: For bash, names are filtered by prefix here since bash only
+    #       does prefix matching anyway. A prefix tree isn't used
+    #       because each completion runs in a new process, so building
+    #       one would cost more than this single pass over the names.
+    #       For fish, all names are printed so fish can do its own fuzzy
+    #       and substring matching.
+    if shell in ("sh", "bash"):
+        print_lines([name for name in collection if name.startswith(prefix)])
+    elif shell == "fish":
+        lines = []
+        for name in collection:
+            cmd = collection[name]
+            description = cmd.description
+            description = description.splitlines()[0].strip() if description else ""
+            lines.append(f"{name}\t{description}")
+        print_lines(lines)
+
+
+def print_paths(path):
+    """Print paths that start with ``path``.
+
+    This is equivalent to ``glob.glob(f"{path}*")``, but when the
+    directory portion of ``path`` is literal (the typical case), only
+    that directory is scanned.
+
+    """
+    if any(char in path for char in "*?["):
+        print_lines(
+            f"{entry}/" if os.path.isdir(entry) else entry
+            for entry in glob.glob(f"{path}*")
+        )
+        return
+
+    parent, sep, stem = path.rpartition(os.sep)
+    parent = f"{parent}{sep}"
+    include_hidden = stem.startswith(".")
+
+    try:
+        entries = os.scandir(parent or ".")
+    except OSError:
+        return
+
+    lines = []
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not name.startswith(stem):
+                continue
+            if name.startswith(".") and not include_hidden:
+                continue
+            if entry.is_dir():
+                lines.append(f"{parent}{name}/")
+            else:
+                lines.append(f"{parent}{name}")
+    print_lines(lines)
 
 
 def print_command_options(cmd, prefix=""):
-    for name, cmd_arg in cmd.args.items():
-        for option in cmd_arg.all_options:
-            if option.startswith(prefix):
-                print(option)
+    options = cmd.sorted_options
+    # Options are sorted, so those that start with the prefix are
+    # contiguous.
+    options = islice(options, bisect_left(options, prefix), None)
+    print_lines(takewhile(lambda option: option.startswith(prefix), options))
+
+
+def print_lines(lines):
+    """Print lines with a single write.
+
+    Completions can include many lines, so they're written all at once
+    rather than via a :func:`print` call per line.
+
+    """
+    output = "\n".join(lines)
+    if output:
+        sys.stdout.write(f"{output}\n")
@@ -1,17 +1,27 @@
 import os
-import shlex
-from subprocess import CompletedProcess
-from typing import Mapping
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
 
 from cached_property import cached_property
 
 from .exc import RunCommandsError
 
+if TYPE_CHECKING:
+    from subprocess import CompletedProcess
+
 
 class Result(RunCommandsError):
     def __init__(self, args, return_code, stdout, stderr):
-        args = shlex.split(args) if isinstance(args, str) else args
+        if isinstance(args, str):
+            import shlex
+
+            args = shlex.split(args)
         self.args = args
+        if isinstance(args, Mapping):
+            self.args_str = " ".join(f"{k} => {v}" for k, v in args.items())
+        else:
+            # XXX: Assume list, tuple, or some other kind of sequence
+            self.args_str = " ".join(map(str, args))
         self.return_code = return_code
         self.stdout = stdout
         self.stderr = stderr
@@ -19,7 +29,7 @@ class Result(RunCommandsError):
         self.failed = not self.succeeded
 
     @classmethod
-    def from_subprocess_result(cls, result: CompletedProcess):
+    def from_subprocess_result(cls, result: "CompletedProcess"):
         return cls(
             result.args,
             result.returncode,
@@ -27,14 +37,6 @@ class Result(RunCommandsError):
             result.stderr,
         )
 
-    @cached_property
-    def args_str(self):
-        args = self.args
-        if isinstance(args, Mapping):
-            return " ".join(f"{k} => {v}" for k, v in args.items())
-        # XXX: Assume list, tuple, or some other kind of sequence
-        return " ".join(str(a) for a in args)
-
     @cached_property
     def stdout_lines(self):
         return self.stdout.splitlines() if self.stdout else []
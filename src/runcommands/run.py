@@ -1,8 +1,9 @@
 import os
+import re
 import sys
-import toml
+from collections.abc import Mapping, Sequence
+from contextlib import redirect_stderr
 from importlib import import_module
-from pathlib import Path
 
 from . import __version__
 from .args import arg, json_value
@@ -12,19 +13,35 @@ from .exc import RunAborted, RunnerError
 from .runner import CommandRunner
 from .util import (
     abs_path,
-    is_mapping,
     is_project_root,
-    is_sequence,
+    load_toml,
     merge_dicts,
+    merge_dicts_in_place,
     module_from_path,
     printer,
 )
 
+# Guards against circular references like {x = "{{ x }}"} when
+# interpolating.
+_max_interpolation_depth = 32
+
+# Matches interpolation groups like {{ key }}. A group preceded by a
+# backslash is escaped and won't be interpolated.
+_interpolation_group_re = re.compile(r"(\\)?\{\{([^{}]*)\}\}")
+
+# Matches args that look like options: -x or --xyz but not -, --, or
+# ---xyz.
+_option_re = re.compile(r"--?[^-]")
+
 
 class Run(Command):
 
     name = "runcommands"
 
+    # Names of files to search for, in order of preference
+    commands_file_names = ("runcommands.py", "commands.py")
+    config_file_names = ("runcommands.toml", "commands.toml", "pyproject.toml")
+
     allowed_config_file_args = (
         "globals",
         "envs",
@@ -104,12 +121,26 @@ class Run(Command):
         a value and not a command name.
 
         """
-        commands_module = self.find_commands_module(commands_module)
+        # Find the commands and config files (if not specified) with
+        # a single walk up the directory tree.
+        commands_file, default_config_file = self.find_files(
+            () if commands_module else self.commands_file_names,
+            () if config_file else self.config_file_names,
+        )
+
+        if commands_module:
+            commands_module = self.find_commands_module(commands_module)
+        elif commands_file is not None:
+            commands_module = module_from_path("commands", commands_file)
 
         if commands_module is None:
             raise RunnerError("Could not find commands module")
 
-        config_file = self.find_config_file(config_file)
+        if config_file:
+            config_file = self.find_config_file(config_file)
+        else:
+            config_file = default_config_file
+
         collection = Collection.load_from_module(commands_module)
         cli_globals = globals_ or {}
 
@@ -123,8 +154,11 @@ class Run(Command):
             cli_globals["debug"] = debug
 
         if config_file:
-            args_from_file = self.read_config_file(config_file, collection)
-            args = merge_dicts(args_from_file, {"environ": environ or {}})
+            # NOTE: The args read from the config file are a fresh
+            #       copy, so they're merged into in place below.
+            args = self.read_config_file(config_file, collection)
+            if environ:
+                merge_dicts_in_place(args["environ"], environ)
             config_file_globals = args["globals"]
             env = env or config_file_globals.get("env")
 
@@ -141,32 +175,45 @@ class Run(Command):
                 # the global envs dict (for inspection purposes).
                 env_default_args = env_globals.pop("args")
 
-                globals_ = merge_dicts(config_file_globals, env_globals, cli_globals)
+                globals_ = merge_dicts_in_place(
+                    config_file_globals, env_globals, cli_globals
+                )
                 globals_["envs"] = envs
 
                 env_globals["args"] = env_default_args
             else:
                 env_default_args = {}
-                globals_ = merge_dicts(config_file_globals, cli_globals)
+                globals_ = merge_dicts_in_place(config_file_globals, cli_globals)
 
-            base_default_args = merge_dicts(args["args"], env_default_args)
+            base_default_args = merge_dicts_in_place(args["args"], env_default_args)
 
-            default_args = {name: {} for name in collection}
-            default_args = merge_dicts(default_args, base_default_args)
+            default_args = {}
 
-            for command_name, command_default_args in default_args.items():
-                command = collection[command_name]
+            # Normalize global names once up front rather than once per
+            # command.
+            globals_items = [
+                (name, Command.normalize_name(name), value)
+                for name, value in globals_.items()
+            ]
+
+            for command_name, command in collection.items():
+                # Copy so the base default args aren't modified below.
+                command_default_args = dict(base_default_args.get(command_name, ()))
 
                 # Add globals that correspond to this command (that
-                # aren't present in default args section).
-                for name, value in globals_.items():
-                    param = command.find_parameter(name)
+                # aren't present in default args section). This is
+                # equivalent to using Command.find_parameter().
+                parameter_map = command.parameter_map
+                has_kwargs = command.has_kwargs
+                for name, normalized_name, value in globals_items:
+                    param = parameter_map.get(name)
+                    if param is None:
+                        param = parameter_map.get(normalized_name)
                     if param is not None:
                         if param.name not in command_default_args:
                             command_default_args[param.name] = value
-                    elif command.has_kwargs:
-                        name = Command.normalize_name(name)
-                        command_default_args[name] = value
+                    elif has_kwargs:
+                        command_default_args[normalized_name] = value
 
                 if "default_args" not in default_args:
                     # This gives commands access to both their own and
@@ -174,18 +221,20 @@ class Run(Command):
                     if command.find_parameter("default_args"):
                         command_default_args["default_args"] = base_default_args
 
+                # Only commands that actually have default args are
+                # included.
+                if not command_default_args:
+                    continue
+
                 # Convert lists to tuples for the command's args that are
                 # specified as being tuples.
                 for name, value in command_default_args.items():
-                    command_arg = command.find_arg(name)
-                    if (
-                        command_arg
-                        and command_arg.container
-                        and isinstance(value, list)
-                    ):
-                        command_default_args[name] = command_arg.container(value)
+                    if isinstance(value, list):
+                        command_arg = command.find_arg(name)
+                        if command_arg and command_arg.container:
+                            command_default_args[name] = command_arg.container(value)
 
-            default_args = {name: args for name, args in default_args.items() if args}
+                default_args[command_name] = command_default_args
 
             environ = args["environ"]
         else:
@@ -226,10 +275,14 @@ class Run(Command):
                     printer.debug(label, data)
 
         if environ:
-            os.environ.update(environ)
-
-        collection.set_attrs(debug=debug)
-        collection.set_default_args(default_args)
+            # NOTE: Setting items directly skips the generic
+            #       MutableMapping.update() machinery. os.putenv() isn't
+            #       used because commands may read os.environ.
+            os_environ = os.environ
+            for name, value in environ.items():
+                os_environ[name] = value
+
+        collection.configure(default_args, debug=debug)
         runner = CommandRunner(collection, debug)
 
         if print_and_exit:
@@ -272,16 +325,12 @@ class Run(Command):
         # until the first non-option word is reached. That word is
         # assumed to be the start of commands.
 
-        def looks_like_option(s):
-            return bool(
-                (s.startswith("-") or s.startswith("--"))
-                and not s.startswith("---")
-                and s.strip("-")
-            )
+        looks_like_option = _option_re.match
 
         i = 0
         argc = len(argv)
         run_argv = []
+        option_map = self.option_map
         parse_optional = self.parse_optional
         parse_multi_short_option = self.parse_multi_short_option
 
@@ -293,14 +342,23 @@ class Run(Command):
                 i += 1
                 break
 
-            option_data = parse_optional(a)
+            # Look up the arg directly first since it will usually be an
+            # option name or a word; only fall back to parsing it when it
+            # might be an --opt=<value> arg.
+            option = option_map.get(a)
+            if option is not None:
+                option_data = a, option, None
+            elif "=" in a:
+                option_data = parse_optional(a)
+            else:
+                option_data = None
 
             if option_data is not None:
                 # Arg is a known run option.
                 name, option, value = option_data
                 run_argv.append(a)
 
-                if a in ("-d", "--debug"):
+                if a == "-d" or a == "--debug":
                     self.debug = True
                 elif value is None and option.takes_value:
                     # Collect the option's value if it takes one and one
@@ -330,10 +388,9 @@ class Run(Command):
                         # Collect the last short option's value if it
                         # takes one and one wasn't provided via
                         # -abc<value>.
-                        option_data = parse_optional(short_options[-1])
-                        if option_data is not None:
-                            name, option, value = option_data
-                            if value is None and option.takes_value:
+                        option = option_map.get(short_options[-1])
+                        if option is not None:
+                            if option.takes_value:
                                 j = i + 1
                                 if j < argc:
                                     run_argv.append(argv[j])
@@ -344,6 +401,56 @@ class Run(Command):
         command_argv = argv[i:]
         return argv, run_argv, command_argv
 
+    def get_commands_module_option(self, run_argv):
+        """Get the value of the commands module option from ``run_argv``.
+
+        This is a shortcut for when *only* the commands module is
+        needed (e.g., for completion), so the full arg parser doesn't
+        have to be built in the common case. The plain forms of the
+        option (``-m X``, ``-mX``, ``-m=X``, ``--commands-module X``,
+        and ``--commands-module=X``) are handled directly. If any other
+        unrecognized option is found, such as grouped short options
+        like ``-dmX``, the arg parser is used instead. As with the arg
+        parser, the last occurrence of the option wins. ``None`` is
+        returned if the option isn't present (or if the args can't be
+        parsed).
+
+        """
+        option_map = self.option_map
+        parse_optional = self.parse_optional
+        commands_module = None
+        i = 0
+        argc = len(run_argv)
+        while i < argc:
+            a = run_argv[i]
+            i += 1
+            if a[:1] != "-":
+                # Option value or other non-option arg
+                continue
+            if a == "-m" or a == "--commands-module":
+                if i < argc:
+                    commands_module = run_argv[i]
+                    i += 1
+            elif a.startswith("--commands-module="):
+                commands_module = a[18:]
+            elif a[:2] == "-m":
+                commands_module = a[3:] if a[2] == "=" else a[2:]
+            elif a in option_map:
+                if option_map[a].takes_value:
+                    i += 1
+            elif "=" not in a or parse_optional(a) is None:
+                return self._parse_commands_module_option(run_argv)
+        return commands_module
+
+    def _parse_commands_module_option(self, run_argv):
+        with open(os.devnull, "w") as devnull_fp:
+            with redirect_stderr(devnull_fp):
+                try:
+                    run_args = self.parse_args(run_argv)
+                except SystemExit:
+                    return None
+        return run_args.get("commands_module")
+
     def find_commands_module(self, commands_module, start_dir="."):
         if commands_module:
             if commands_module.endswith(".py"):
@@ -361,21 +468,24 @@ class Run(Command):
                     raise RunnerError(
                         f"Commands module could not be imported: {commands_module}"
                     )
-        current_dir = Path(start_dir).resolve()
-        file_system_root = Path(current_dir.root)
-        checked_file_system_root = False
-        candidates = ("runcommands.py", "commands.py")
-        while not checked_file_system_root:
-            for candidate in candidates:
-                candidate = current_dir / candidate
-                if candidate.is_file():
-                    return module_from_path("commands", candidate)
-            if current_dir == file_system_root:
-                checked_file_system_root = True
-            if is_project_root(current_dir):
-                break
-            current_dir = current_dir.parent
-        return None
+        commands_file = self.find_commands_file(start_dir)
+        if commands_file is None:
+            return None
+        return module_from_path("commands", commands_file)
+
+    def find_commands_file(self, start_dir="."):
+        """Find commands file by searching upward from ``start_dir``.
+
+        The search stops at the project root (see
+        :func:`is_project_root`) or the file system root, whichever
+        comes first.
+
+        Returns:
+            str: When a commands file is found
+            None: When a commands file isn't found
+
+        """
+        return self.find_files(self.commands_file_names, start_dir=start_dir)[0]
 
     def find_config_file(self, config_file, start_dir="."):
         if config_file:
@@ -383,28 +493,54 @@ class Run(Command):
             if not os.path.exists(config_file):
                 raise RunnerError(f"Config file does not exists: {config_file}")
             return config_file
-        current_dir = Path(start_dir).resolve()
-        file_system_root = Path(current_dir.root)
-        checked_file_system_root = False
-        candidates = ("runcommands.toml", "commands.toml", "pyproject.toml")
-        while not checked_file_system_root:
-            for candidate in candidates:
-                candidate = current_dir / candidate
-                if candidate.is_file():
-                    return candidate
-            if current_dir == file_system_root:
-                checked_file_system_root = True
-            if is_project_root(current_dir):
+        return self.find_files(self.config_file_names, start_dir=start_dir)[0]
+
+    def find_files(self, *candidates, start_dir="."):
+        """Find files by searching upward from ``start_dir``.
+
+        Each item in ``candidates`` is a sequence of file names in
+        order of preference. The first file found for each is returned
+        (or ``None`` if no file is found). An empty sequence of names
+        is skipped.
+
+        The search stops when files have been found for all candidates
+        or when the project root (see :func:`is_project_root`) or file
+        system root is reached, whichever comes first.
+
+        Each directory is listed once regardless of how many names are
+        being looked for.
+
+        """
+        found = [None] * len(candidates)
+        remaining = [i for i, names in enumerate(candidates) if names]
+        current_dir = os.path.realpath(start_dir)
+        while remaining:
+            try:
+                with os.scandir(current_dir) as entries:
+                    entries = {entry.name: entry for entry in entries}
+            except OSError:
+                entries = {}
+            for i in tuple(remaining):
+                for name in candidates[i]:
+                    entry = entries.get(name)
+                    if entry is not None and entry.is_file():
+                        found[i] = os.path.join(current_dir, name)
+                        remaining.remove(i)
+                        break
+            if is_project_root(current_dir, entries):
+                break
+            parent = os.path.dirname(current_dir)
+            if parent == current_dir:
+                # File system root
                 break
-            current_dir = current_dir.parent
-        return None
+            current_dir = parent
+        return found
 
     def read_config_file(self, config_file, collection):
         return self._read_config_file(config_file, collection)
 
     def _read_config_file(self, config_file, collection):
-        with open(config_file) as fp:
-            args = toml.load(fp)
+        args = load_toml(config_file)
 
         if os.path.basename(config_file) == "pyproject.toml":
             tool = args.get("tool") or {}
@@ -417,9 +553,10 @@ class Run(Command):
 
         extends = args.pop("extends", None)
 
-        for name in tuple(args):
-            if name not in self.allowed_config_file_args:
-                raise RunnerError(f"Arg cannot be specified in config file: {name}")
+        disallowed = args.keys() - set(self.allowed_config_file_args)
+        if disallowed:
+            name = next(name for name in args if name in disallowed)
+            raise RunnerError(f"Arg cannot be specified in config file: {name}")
 
         self.normalize_command_and_arg_names(args["args"], collection)
 
@@ -451,23 +588,37 @@ class Run(Command):
             if command.name != command_name:
                 config[command.name] = config.pop(command_name)
 
+            # Args are collected under their normalized names in a new
+            # dict, which replaces the original only if a name changed.
             command_default_args = config[command.name]
-            for name in tuple(command_default_args):
+            normalized_args = {}
+            renamed = False
+            for name, value in command_default_args.items():
                 param = command.find_parameter(name)
                 if param is None:
                     raise RunnerError(
                         f"Unknown arg for command {command_name} in "
                         f"default args section of config file: {name}"
                     )
-                if param is not None and name != param.name:
-                    command_default_args[param.name] = command_default_args.pop(name)
+                if name != param.name:
+                    renamed = True
+                normalized_args[param.name] = value
+            if renamed:
+                config[command.name] = normalized_args
 
     def interpolate(self, globals_, default_args, environ):
+        if not self._has_template(globals_, default_args, environ):
+            # Nothing to interpolate; skip copying everything.
+            return globals_, default_args, environ
+
         if globals_:
             globals_ = self._interpolate(globals_, globals_)
 
         if default_args:
-            context = merge_dicts(globals_, default_args)
+            if globals_:
+                context = merge_dicts(globals_, default_args)
+            else:
+                context = default_args
             default_args = self._interpolate(default_args, context)
 
         if environ:
@@ -475,54 +626,91 @@ class Run(Command):
 
         return globals_, default_args, environ
 
+    def _has_template(self, *objs):
+        """Check whether any of ``objs`` contain strings with ``{{``."""
+        stack = list(objs)
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            obj = pop()
+            if isinstance(obj, str):
+                if "{{" in obj:
+                    return True
+            # str was handled above, so plain isinstance checks are
+            # used here instead of is_mapping() and is_sequence().
+            elif isinstance(obj, Mapping):
+                extend(obj.values())
+            elif isinstance(obj, Sequence):
+                extend(obj)
+        return False
+
     def _interpolate(self, obj, context):
-        if is_mapping(obj):
-            items = ((k, self._interpolate(v, context)) for k, v in obj.items())
-            obj = obj.__class__(items)
-        elif is_sequence(obj):
-            items = (self._interpolate(v, context) for v in obj)
-            obj = obj.__class__(items)
-        else:
-            obj = self._inject(obj, context)
+        if isinstance(obj, str):
+            # Most values are plain strings; check for them first to
+            # skip the (relatively slow) ABC checks below, and skip
+            # injection entirely when there's nothing to inject.
+            if "{{" not in obj:
+                return obj
+            return self._inject(obj, context)
+        # Containers are only rebuilt when one of their items changes;
+        # otherwise, the original container is returned as is. As in
+        # _has_template(), str was handled above.
+        if isinstance(obj, Mapping):
+            items = [(k, v, self._interpolate(v, context)) for k, v in obj.items()]
+            if any(new_v is not v for _, v, new_v in items):
+                obj = obj.__class__((k, new_v) for k, _, new_v in items)
+        elif isinstance(obj, Sequence):
+            items = [(v, self._interpolate(v, context)) for v in obj]
+            if any(new_v is not v for v, new_v in items):
+                obj = obj.__class__(new_v for _, new_v in items)
         return obj
 
-    def _inject(self, value, context, start=0):
-        if not isinstance(value, str):
-            return value
-        i = value.find("{{", start)
-        if i == -1:
+    def _inject(self, value, context, depth=0):
+        if not isinstance(value, str) or "{{" not in value:
             return value
-        h = i - 1
-        if h >= 0 and value[h] == "\\":
-            return self._inject(value, context, h + 2)
-        j = value.rfind("}}", i + 2)
-        if j == -1:
+
+        def inject_key(key):
+            if depth == _max_interpolation_depth:
+                raise RunnerError(
+                    f'Interpolation depth exceeded (circular reference?): "{value}"'
+                )
+            context_value = self._find_in_context(context, key)
+            return self._inject(context_value, context, depth + 1)
+
+        def replace(match):
+            escaped, key = match.groups()
+            if escaped:
+                return match.group(0)
+            key = key.strip()
+            if not key:
+                # String looks like "{{}} xyz"
+                # XXX: Error?
+                if self.debug:
+                    printer.warning(f'Empty interpolation group in value: "{value}"')
+                return match.group(0)
+            return f"{inject_key(key)}"
+
+        match = _interpolation_group_re.fullmatch(value)
+        if match is not None:
+            escaped, key = match.groups()
+            key = key.strip()
+            if key and not escaped:
+                # The value is a single group, so the context value is
+                # used as is rather than being converted to a string.
+                return inject_key(key)
+
+        if self.debug and value.rfind("}}") < value.rfind("{{"):
             # String looks like "{{ abc"
             # XXX: Error?
-            if self.debug:
-                printer.warning(f'Unclosed interpolation group in value: "{value}"')
-            return value
-        k = j + 2
-        key = value[i + 2 : j].strip()
-        if not key:
-            # String looks like "{{}} xyz"
-            # XXX: Error?
-            if self.debug:
-                printer.warning(f'Empty interpolation group in value: "{value}"')
-            return value
-        context_value = self._find_in_context(context, key)
-        context_value = self._inject(context_value, context)
-        if i == 0 and k == len(value):
-            value = context_value
-        else:
-            value = f"{value[:i]}{context_value}{value[k:]}"
-            value = self._inject(value, context)
-        return value
+            printer.warning(f'Unclosed interpolation group in value: "{value}"')
+
+        return _interpolation_group_re.sub(replace, value)
 
     def _find_in_context(self, context, key):
+        if "." not in key:
+            return context[key]
         value = context
-        parts = key.split(".")
-        for segment in parts:
+        for segment in key.split("."):
             value = value[segment]
         return value
 
@@ -88,6 +88,7 @@ class CommandRunner:
         args = args[1:]
         command_args = []
         partition = [command, command_args]
+        option_map = command.option_map
 
         prev_args = chain([None], args[:-1])
 
@@ -97,10 +98,10 @@ class CommandRunner:
                 # option expecting a value, assume the command name is
                 # the next command to run and not an option value or
                 # positional.
-                option = command.option_map.get(prev_arg)
+                option = option_map.get(prev_arg)
                 if option is None or not option.takes_value:
                     break
-            if arg and arg[0] == ":" and arg != ":" and arg[1:] in collection:
+            if arg[:1] == ":" and arg[1:] in collection:
                 # Found an escaped command name. Unescape it.
                 arg = arg[1:]
             command_args.append(arg)
@@ -112,7 +113,7 @@ class CommandRunner:
             printer.warning("No commands available")
             return
         print("\nAvailable commands:\n")
-        for name in sorted(self.collection):
+        for name in self.collection.sorted_names:
             print(f"    {name}")
         print("\nFor detailed help on a command: runcommands <command> --help")
 
@@ -131,16 +132,14 @@ class CommandToRun:
         # Ignore args after -- when determining whether help was
         # requested for a command because such args aren't command
         # options.
-        try:
-            dash_dash_index = argv.index("--")
-        except ValueError:
-            help_requested_argv = argv
-        else:
-            help_requested_argv = argv[:dash_dash_index]
-
-        self.help_requested = (
-            "-h" in help_requested_argv or "--help" in help_requested_argv
-        )
+        help_requested = False
+        for arg in argv:
+            if arg == "--":
+                break
+            if arg == "-h" or arg == "--help":
+                help_requested = True
+                break
+        self.help_requested = help_requested
 
     def run(self):
         return self.command.run(self.argv, _expand_short_options=False)
@@ -12,7 +12,9 @@ from .misc import (
     is_type,
     isatty,
     load_object,
+    load_toml,
     merge_dicts,
+    merge_dicts_in_place,
 )
 from .path import (
     abs_path,
@@ -40,7 +42,9 @@ __all__ = [
     "is_sequence",
     "is_type",
     "load_object",
+    "load_toml",
     "merge_dicts",
+    "merge_dicts_in_place",
     "abs_path",
     "asset_path",
     "find_project_root",
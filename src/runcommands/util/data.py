@@ -11,20 +11,27 @@ class Data:
     """
 
     def __init__(self, **data):
-        super().__setattr__("__data", {})
         for name, value in data.items():
             self[name] = value
 
+    # NOTE: Data is stored directly in the instance's __dict__ so that
+    #       attribute access doesn't go through __getattr__ (which is
+    #       only called when an attribute isn't found normally).
+
     def __getattr__(self, name):
-        data = super().__getattribute__("__data")
-        return data[name]
+        # Missing attributes raise AttributeError (not KeyError) so that
+        # hasattr() and protocol lookups (e.g., __setstate__ when copying
+        # or unpickling) work as usual.
+        raise AttributeError(
+            f"{self.__class__.__name__!r} object has no attribute {name!r}"
+        )
 
-    __getitem__ = __getattr__
+    def __getitem__(self, name):
+        return self.__dict__[name]
 
     def __setattr__(self, name, value):
-        data = super().__getattribute__("__data")
         if isinstance(value, dict):
             value = self.__class__(**value)
-        data[name] = value
+        self.__dict__[name] = value
 
     __setitem__ = __setattr__
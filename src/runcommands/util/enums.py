@@ -1,6 +1,8 @@
 import enum
 import subprocess
 
+from cached_property import cached_property
+
 
 class Color(enum.Enum):
 
@@ -14,8 +16,12 @@ class Color(enum.Enum):
     cyan = "bright_cyan"
     white = "white"
 
+    def __init__(self, value):
+        # Markup is built once per color rather than on every str().
+        self.markup = f"[{value}]"
+
     def __str__(self):
-        return f"[{self.value}]"
+        return self.markup
 
 
 class StreamOptions(enum.Enum):
@@ -26,7 +32,7 @@ class StreamOptions(enum.Enum):
     hide = "hide"
     none = "none"
 
-    @property
+    @cached_property
     def option(self):
         return {
             "capture": subprocess.PIPE,
@@ -1,24 +1,27 @@
 import builtins
-import functools
+import copy
 import importlib
+import operator
 import os
-from typing import Mapping, Sequence
+from collections.abc import Mapping, Sequence
 
 from ..exc import RunAborted
 
 
 def abort(return_code=0, message="Aborted", color=True):
-    from .printer import printer
+    if message and color:
+        from .printer import printer
 
-    if message:
         if color is True:
             color = "error" if return_code else "warning"
-        if color:
-            message = printer.colorize(message, color=color)
+        message = printer.colorize(message, color=color)
     raise RunAborted(return_code, message)
 
 
-def flatten_args(args: list, join=False, *, empty=(None, [], (), "")) -> list:
+_default_empty_args = (None, [], (), "")
+
+
+def flatten_args(args: list, join=False, *, empty=_default_empty_args) -> list:
     """Flatten args and remove empty items.
 
     Args:
@@ -59,12 +62,23 @@ def flatten_args(args: list, join=False, *, empty=(None, [], (), "")) -> list:
 
     """
     flat_args = []
-    non_empty_args = (arg for arg in args if arg not in empty)
-    for arg in non_empty_args:
-        if isinstance(arg, (list, tuple)):
-            flat_args.extend(flatten_args(arg))
+    append = flat_args.append
+    # NOTE: Nested lists are walked with an explicit stack of iterators
+    #       rather than recursively. As before, only top level items
+    #       are checked against ``empty``; nested items are checked
+    #       against the default empty values.
+    stack = [(iter(args), empty)]
+    while stack:
+        items, empty_items = stack[-1]
+        for arg in items:
+            if arg in empty_items:
+                continue
+            if isinstance(arg, (list, tuple)):
+                stack.append((iter(arg), _default_empty_args))
+                break
+            append(arg if type(arg) is str else str(arg))
         else:
-            flat_args.append(str(arg))
+            stack.pop()
     if join:
         join = " " if join is True else join
         flat_args = join.join(flat_args)
@@ -73,7 +87,7 @@ def flatten_args(args: list, join=False, *, empty=(None, [], (), "")) -> list:
 
 def format_if(value, format_kwargs):
     """Apply format args to value if value or return value as is."""
-    if not value:
+    if not value or ("{" not in value and "}" not in value):
         return value
     return value.format_map(format_kwargs)
 
@@ -84,7 +98,9 @@ def is_mapping(obj):
     This mirrors :func:`is_sequence`.
 
     """
-    return isinstance(obj, Mapping)
+    # Check for the common concrete type first since ABC checks are
+    # relatively slow.
+    return isinstance(obj, dict) or isinstance(obj, Mapping)
 
 
 def is_sequence(obj):
@@ -94,6 +110,9 @@ def is_sequence(obj):
     unwieldy. This makes it simple.
 
     """
+    # As in is_mapping(), check for common concrete types first.
+    if isinstance(obj, (list, tuple)):
+        return True
     return isinstance(obj, Sequence) and not isinstance(obj, str)
 
 
@@ -141,20 +160,48 @@ def load_object(obj) -> object:
 
     """
     if isinstance(obj, str):
-        if ":" in obj:
-            module_name, obj_name = obj.split(":")
-            if not module_name:
-                module_name = "."
-        else:
-            module_name = obj
+        module_name, _, obj_name = obj.partition(":")
+        if not module_name:
+            module_name = "."
         obj = importlib.import_module(module_name)
         if obj_name:
-            attrs = obj_name.split(".")
-            for attr in attrs:
-                obj = getattr(obj, attr)
+            obj = operator.attrgetter(obj_name)(obj)
     return obj
 
 
+def load_toml(path, *, _cache={}) -> dict:
+    """Load TOML file.
+
+    The standard library's :mod:`tomllib` is used when available
+    (Python 3.11+) since it's faster than the ``toml`` package, which
+    is used as a fallback.
+
+    .. note:: Parsed files are cached by path, modification time, and
+        size so that files that are loaded repeatedly (e.g., via
+        ``extends``) are only parsed once. A copy of the cached data is
+        returned so it's safe for callers to modify the result.
+
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+
+    if key not in _cache:
+        try:
+            import tomllib
+        except ImportError:
+            import toml
+
+            with open(path) as fp:
+                data = toml.load(fp)
+        else:
+            with open(path, "rb") as fp:
+                data = tomllib.load(fp)
+        _cache[key] = data
+
+    return copy.deepcopy(_cache[key])
+
+
 def merge_dicts(*dicts):
     """Merge all dicts.
 
@@ -162,16 +209,56 @@ def merge_dicts(*dicts):
     list.
 
     """
-    return functools.reduce(_merge_dicts, dicts, {})
+    # NOTE: Nested dicts are merged with an explicit stack rather than
+    #       recursively. Nested dicts from the input dicts are shared
+    #       until something is merged into them, at which point they're
+    #       copied (tracked by ID in ``owned``) so the inputs are never
+    #       modified.
+    result = {}
+    owned = set()
+    for d in dicts:
+        stack = [(result, d)]
+        while stack:
+            a, b = stack.pop()
+            if not (isinstance(a, dict) and isinstance(b, dict)):
+                raise TypeError(
+                    f"Expected two dicts; got {a.__class__} and {b.__class__}"
+                )
+            for k, v in b.items():
+                if k in a:
+                    a_v = a[k]
+                    if isinstance(a_v, dict):
+                        if id(a_v) not in owned:
+                            a_v = a[k] = a_v.copy()
+                            owned.add(id(a_v))
+                        stack.append((a_v, v))
+                        continue
+                a[k] = v
+    return result
+
+
+def merge_dicts_in_place(a, *dicts):
+    """Merge all dicts into ``a``.
+
+    This is like :func:`merge_dicts` except that ``a`` is modified in
+    place rather than copied, so it should only be used when ``a`` is
+    owned by the caller. Nested dicts are copied from the other dicts
+    as they're merged in, so those dicts won't be modified later.
+
+    """
+    for b in dicts:
+        _merge_dicts_in_place(a, b)
+    return a
 
 
-def _merge_dicts(a, b):
-    # Merge dict b into dict a
-    a = a.copy()
+def _merge_dicts_in_place(a, b):
     if not (isinstance(a, dict) and isinstance(b, dict)):
         raise TypeError(f"Expected two dicts; got {a.__class__} and {b.__class__}")
     for k, v in b.items():
         if k in a and isinstance(a[k], dict):
-            v = merge_dicts(a[k], v)
-        a[k] = v
+            _merge_dicts_in_place(a[k], v)
+        elif isinstance(v, dict):
+            a[k] = _merge_dicts_in_place({}, v)
+        else:
+            a[k] = v
     return a
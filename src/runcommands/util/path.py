@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from importlib import import_module
 from importlib.util import module_from_spec, spec_from_file_location
 from pathlib import Path
@@ -20,6 +21,9 @@ def abs_path(path, format_kwargs={}, relative_to=None, keep_slash=False):
     If ``path`` ends with a slash, it will be stripped unless
     ``keep_slash`` is set (for use with ``rsync``, for example).
 
+    .. note:: Results for absolute paths and asset paths are cached
+        since they don't depend on the current working directory.
+
     >>> file_path = os.path.normpath(__file__)
     >>> dir_name = os.path.dirname(file_path)
     >>> file_name = os.path.basename(file_path)
@@ -43,21 +47,42 @@ def abs_path(path, format_kwargs={}, relative_to=None, keep_slash=False):
     True
 
     """
-    if format_kwargs:
+    if format_kwargs and ("{" in path or "}" in path):
         path = path.format_map(format_kwargs)
 
+    if os.path.isabs(path) or ":" in path:
+        return _abs_path_cached(path, keep_slash)
+
+    has_slash = path.endswith(os.sep)
+
+    # Relative paths depend on the current working directory (and on
+    # $HOME when they start with ~), so they're not cached.
+    path = os.path.expanduser(path)
+    if relative_to:
+        path = os.path.join(relative_to, path)
+    # NOTE: abspath() normalizes the path too.
+    path = os.path.abspath(path)
+
+    if has_slash and keep_slash:
+        path = f"{path}{os.sep}"
+
+    return path
+
+
+@lru_cache(maxsize=256)
+def _abs_path_cached(path, keep_slash):
+    """Get abs. path for an absolute path or asset path.
+
+    The result for these kinds of paths doesn't depend on the current
+    working directory, so it's safe to cache.
+
+    """
     has_slash = path.endswith(os.sep)
 
     if os.path.isabs(path):
         path = os.path.normpath(path)
-    elif ":" in path:
-        path = asset_path(path, keep_slash=False)
     else:
-        path = os.path.expanduser(path)
-        if relative_to:
-            path = os.path.join(relative_to, path)
-        path = os.path.abspath(path)
-        path = os.path.normpath(path)
+        path = asset_path(path, keep_slash=False)
 
     if has_slash and keep_slash:
         path = f"{path}{os.sep}"
@@ -94,7 +119,7 @@ def asset_path(path, format_kwargs={}, keep_slash=False):
     True
 
     """
-    if format_kwargs:
+    if format_kwargs and ("{" in path or "}" in path):
         path = path.format_map(format_kwargs)
 
     has_slash = path.endswith(os.sep)
@@ -105,17 +130,16 @@ def asset_path(path, format_kwargs={}, keep_slash=False):
         package_name, rel_path = path, ()
 
     try:
-        package = import_module(package_name)
+        package_path = _get_package_dir(package_name)
     except ImportError:
         raise ValueError(
             f"Could not get asset path for {path}; could not import package: "
             f"{package_name}"
         )
 
-    if not hasattr(package, "__file__"):
+    if package_path is None:
         raise ValueError("Can't compute path relative to namespace package")
 
-    package_path = os.path.dirname(package.__file__)
     path = os.path.join(package_path, *rel_path)
     path = os.path.normpath(path)
 
@@ -125,6 +149,15 @@ def asset_path(path, format_kwargs={}, keep_slash=False):
     return path
 
 
+@lru_cache(maxsize=None)
+def _get_package_dir(package_name):
+    """Get directory containing package or ``None`` for namespace pkg."""
+    package = import_module(package_name)
+    if not hasattr(package, "__file__"):
+        return None
+    return os.path.dirname(package.__file__)
+
+
 def paths_to_str(
     paths,
     format_kwargs={},
@@ -151,16 +184,27 @@ def paths_to_str(
     if isinstance(paths, str):
         paths = paths.split(delimiter)
     processed_paths = []
+    # Paths lists often contain duplicates, so each distinct path is
+    # only checked once per call.
+    is_dir_cache = {}
     for path in paths:
         original = path
-        path = path.format_map(format_kwargs)
+        # Formatting a path without braces is a no-op, so it's skipped.
+        if "{" in path or "}" in path:
+            path = path.format_map(format_kwargs)
         if not os.path.isabs(path):
             if asset_paths and ":" in path:
                 try:
                     path = asset_path(path)
                 except ValueError:
                     path = None
-        if path is not None and os.path.isdir(path):
+        if path is not None:
+            is_dir = is_dir_cache.get(path)
+            if is_dir is None:
+                is_dir = is_dir_cache[path] = os.path.isdir(path)
+        else:
+            is_dir = False
+        if is_dir:
             processed_paths.append(path)
         elif check_paths:
             printer.warning(f"Path does not exist: {path} (from {original})")
@@ -191,18 +235,28 @@ def find_project_root(start_dir="."):
     return current_dir
 
 
-def is_project_root(path):
+def is_project_root(path, entries=None):
     """Is the path a project root?
 
     A project root is a directory that contains a source control
     subdirectory (git, hg, and svn).
 
+    If the directory has already been listed, ``entries`` can be passed
+    as a mapping of names to :class:`os.DirEntry` objects (as returned
+    by :func:`os.scandir`) to avoid checking the file system again.
+
     todo:: Be more inclusive.
 
     """
     candidates = (".git", ".hg", ".svn")
+    if entries is not None:
+        for candidate in candidates:
+            entry = entries.get(candidate)
+            if entry is not None and entry.is_dir():
+                return True
+        return False
     for candidate in candidates:
-        if (path / candidate).is_dir():
+        if os.path.isdir(os.path.join(path, candidate)):
             return True
     return False
 
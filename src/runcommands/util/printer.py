@@ -3,10 +3,9 @@ import os
 from functools import partial
 from typing import Mapping
 
-from rich.console import Console
+from cached_property import cached_property
 
 from .enums import Color
-from .misc import is_type
 
 
 class ColorMap:
@@ -21,12 +20,11 @@ class ColorMap:
         setattr(self, name, color)
 
     def add_colors(self, color_map: Mapping[str, str]):
-        if is_type(color_map, enum.Enum):
-            items = ((color.name, color) for color in color_map)
+        if isinstance(color_map, type) and issubclass(color_map, enum.Enum):
+            colors = {color.name: color for color in color_map}
         else:
-            items = color_map.items()
-        for name, color in items:
-            setattr(self, name, color)
+            colors = dict(color_map)
+        self.__dict__.update(colors)
 
 
 class Printer:
@@ -60,40 +58,93 @@ class Printer:
         if color_map:
             self.color_map.add_colors(color_map)
         self.default_color = self.get_color(default_color)
-        self.stdout_console = Console()
-        self.stderr_console = Console(stderr=True)
+
+    # NOTE: Consoles are created on first use since creating them
+    #       involves probing the terminal, which is unnecessary when
+    #       nothing is printed. For the same reason, rich is imported
+    #       only when a console is needed.
+
+    @cached_property
+    def stdout_console(self):
+        from rich.console import Console
+
+        return Console()
+
+    @cached_property
+    def stderr_console(self):
+        from rich.console import Console
+
+        return Console(stderr=True)
 
     def __call__(self, *args, **kwargs):
         self.print(*args, **kwargs)
 
-    def __getattr__(self, color):
-        # self.red("...")
-        return partial(self.stdout_console.print, style=str(color))
+    def __getattr__(self, name):
+        # self.red("..."), self.bold("..."), etc
+        # Only known colors and valid rich styles are handled; anything
+        # else (including dunder lookups) is a regular missing attribute.
+        # The method is cached on the instance so subsequent lookups
+        # don't go through __getattr__.
+        if name.startswith("_") or not self._is_style(name):
+            raise AttributeError(
+                f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            )
+        method = partial(self._print_with_style, style=name)
+        self.__dict__[name] = method
+        return method
+
+    def _is_style(self, name):
+        if name in self.color_map.__dict__:
+            return True
+        from rich.errors import StyleSyntaxError
+        from rich.style import Style
+
+        try:
+            Style.parse(name)
+        except StyleSyntaxError:
+            return False
+        return True
+
+    def _print_with_style(self, *args, style, **kwargs):
+        # The console is looked up on each call rather than bound when
+        # the method is created so a replaced console is always used.
+        self.stdout_console.print(*args, style=style, **kwargs)
 
     def get_color(self, color):
         if color is None:
             return None
+        # NOTE: The color map's instance dict is used directly as the
+        #       lookup table so that colors added after the printer is
+        #       created are found too. Color members never match a key
+        #       since enum members only compare equal to themselves.
+        try:
+            return self.color_map.__dict__[color]
+        except (KeyError, TypeError):
+            pass
         if isinstance(color, self.colors):
             return color
-        try:
-            return self.color_map[color]
-        except KeyError:
-            raise ValueError(f"Unknown color: {color}") from None
+        raise ValueError(f"Unknown color: {color}")
 
     def colorize(self, *args, color=None, sep=" "):
         if not args:
             return ""
-        if color is not None:
-            color = self.get_color(color)
-            args = (color,) + args
-        string = []
-        for arg in args[:-1]:
-            string.append(str(arg))
-            if not isinstance(arg, self.colors):
-                string.append(sep)
-        string.append(str(args[-1]))
-        string = "".join(string)
-        return string
+        colors = self.colors
+        # Color markup is attached directly to the following arg (no
+        # separator); other args are joined with the separator.
+        markup = "" if color is None else str(self.get_color(color))
+        parts = []
+        append = parts.append
+        for arg in args:
+            if isinstance(arg, colors):
+                markup += str(arg)
+            elif markup:
+                append(f"{markup}{arg}")
+                markup = ""
+            else:
+                append(arg if type(arg) is str else str(arg))
+        if markup:
+            append(markup)
+        return sep.join(parts)
 
     def print(
         self,
@@ -117,43 +168,43 @@ class Printer:
         self.print(*args, color=color, style=style, **kwargs)
         self.print()
 
-    def info(self, *args, color=None, **kwargs):
-        if color is None:
-            color = self.color_map.info
-        self.print(*args, color=color, **kwargs)
+    def _make_print_method(name, stderr=False):
+        """Make a method that prints in the ``name`` color by default.
 
-    def success(self, *args, color=None, **kwargs):
-        if color is None:
-            color = self.color_map.success
-        self.print(*args, color=color, **kwargs)
+        The color is looked up when the method is called so changes to
+        the printer's color map are respected.
 
-    def echo(self, *args, color=None, **kwargs):
-        if color is None:
-            color = self.color_map.echo
-        self.print(*args, color=color, **kwargs)
+        """
 
-    def warning(self, *args, color=None, stderr=True, **kwargs):
-        if color is None:
-            color = self.color_map.warning
-        self.print(*args, color=color, stderr=stderr, **kwargs)
+        def method(self, *args, color=None, stderr=stderr, **kwargs):
+            if color is None:
+                color = self.color_map[name]
+            self.print(*args, color=color, stderr=stderr, **kwargs)
 
-    def error(self, *args, color=None, stderr=True, **kwargs):
-        if color is None:
-            color = self.color_map.error
-        self.print(*args, color=color, stderr=stderr, **kwargs)
+        method.__name__ = name
+        method.__qualname__ = f"Printer.{name}"
+        return method
 
-    def danger(self, *args, color=None, stderr=True, **kwargs):
-        if color is None:
-            color = self.color_map.danger
-        self.print(*args, color=color, stderr=stderr, **kwargs)
+    info = _make_print_method("info")
+    success = _make_print_method("success")
+    echo = _make_print_method("echo")
+    warning = _make_print_method("warning", stderr=True)
+    error = _make_print_method("error", stderr=True)
+    danger = _make_print_method("danger", stderr=True)
+    debug = _make_print_method("debug", stderr=True)
 
-    def debug(self, *args, color=None, stderr=True, **kwargs):
-        if color is None:
-            color = self.color_map.debug
-        self.print(*args, color=color, stderr=stderr, **kwargs)
+    del _make_print_method
 
     def hr(self, *args, color=None, fill_char="─", align="center", **kwargs):
         """Print a horizontal with optional title"""
+        console = self.stdout_console
+        if not (args or color or kwargs) and len(fill_char) == 1:
+            # When output isn't going to a terminal, a plain rule is
+            # just a line of fill characters, so rich's rendering can
+            # be skipped.
+            if not console.is_terminal:
+                console.file.write(f"{fill_char * console.width}\n")
+                return
         kwargs["characters"] = fill_char
         kwargs["align"] = align
         if "end" in kwargs:
@@ -164,7 +215,7 @@ class Printer:
             kwargs["title"] = sep.join(args)
         if color:
             kwargs["style"] = self.get_color(color).value
-        self.stdout_console.rule(**kwargs)
+        console.rule(**kwargs)
 
 
 printer = Printer()
@@ -1,14 +1,17 @@
-from rich.prompt import Confirm, Prompt, InvalidResponse
+from functools import lru_cache
 
 from .misc import abort
 from .printer import printer
 
 
 def prompt(message, password=False, choices=None, default=None, color=True):
+    from rich.prompt import Prompt
+
     if color is True:
         color = "warning"
     if color:
         message = printer.colorize(message, color=color)
+
     try:
         return Prompt.ask(message, password=password, choices=choices, default=default)
     except KeyboardInterrupt:
@@ -16,6 +19,14 @@ def prompt(message, password=False, choices=None, default=None, color=True):
         abort()
 
 
+_abort_on_unconfirmed_options = {
+    bool: lambda value: {"return_code": 0},
+    int: lambda value: {"return_code": value},
+    str: lambda value: {"message": value},
+    object: lambda value: {"return_code": 0},
+}
+
+
 def confirm(
     prompt="Really?",
     color="warning",
@@ -55,6 +66,7 @@ def confirm(
         prompt = printer.colorize(prompt, color=color)
 
     choices = [yes_value, "n"]
+    Confirm = _get_confirm_class()
 
     try:
         confirmed = Confirm.ask(prompt, choices=choices, default=False)
@@ -75,51 +87,70 @@ def confirm(
     )
 
     if do_abort_on_unconfirmed:
-        if abort_options is None:
-            abort_options = {}
-
-        if abort_on_unconfirmed is True:
-            abort_options.setdefault("return_code", 0)
-        elif isinstance(abort_on_unconfirmed, int):
-            abort_options.setdefault("return_code", abort_on_unconfirmed)
-        elif isinstance(abort_on_unconfirmed, str):
-            abort_options.setdefault("message", abort_on_unconfirmed)
-        else:
-            abort_options.setdefault("return_code", 0)
-
-        abort(**abort_options)
+        # Look up default abort options by type, including base types
+        # (bool is checked before int since it's a subclass of int).
+        for type_ in type(abort_on_unconfirmed).__mro__:
+            get_options = _abort_on_unconfirmed_options.get(type_)
+            if get_options is not None:
+                break
+        options = get_options(abort_on_unconfirmed)
+        if abort_options:
+            options.update(abort_options)
+        abort(**options)
 
     return confirmed
 
 
-class Confirm(Confirm):
-    @property
-    def validate_error_message(self):
-        yes, no = self.choices
-        return f"[prompt.invalid]Please enter {yes} or {no}"
-
-    def render_default(self, default):
-        """Default is *always* no."""
-        return "(n)"
-
-    def process_response(self, value):
-        value = value.strip()
-        # Hitting enter without a value -> "n" -> unconfirmed
-        if not value:
-            return False
-        yes, no = self.choices
-        # If yes value contains *any* upper case characters, do case-
-        # sensitive yes value comparison
-        all_lower = all(c.islower() for c in yes)
-        if all_lower:
+# NOTE: rich is imported only when a prompt is actually shown to keep
+#       import time down. The Confirm subclass is created on first use
+#       and is still available as ``prompt.Confirm`` via the module
+#       __getattr__ below.
+
+
+@lru_cache(maxsize=None)
+def _get_confirm_class():
+    from rich.prompt import Confirm as BaseConfirm, InvalidResponse
+
+    class Confirm(BaseConfirm):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            # If yes value contains *any* upper case characters, do
+            # case-sensitive yes value comparison
+            yes = self.choices[0]
+            self.yes_is_all_lower = all(c.islower() for c in yes)
+
+        @property
+        def validate_error_message(self):
+            yes, no = self.choices
+            return f"[prompt.invalid]Please enter {yes} or {no}"
+
+        def render_default(self, default):
+            """Default is *always* no."""
+            return "(n)"
+
+        def process_response(self, value):
+            value = value.strip()
+            # Hitting enter without a value -> "n" -> unconfirmed
+            if not value:
+                return False
+            yes, no = self.choices
+            if self.yes_is_all_lower:
+                value = value.lower()
+            if value == yes:
+                return True
             value = value.lower()
-        if value == yes:
-            return True
-        value = value.lower()
-        # Allow "yes" when yes value is lower case "y"
-        if yes == "y" and value == "yes":
-            return True
-        # Always allow "no"
-        if value in ("n", "no"):
-            return False
-        raise InvalidResponse(self.validate_error_message)
+            # Allow "yes" when yes value is lower case "y"
+            if yes == "y" and value == "yes":
+                return True
+            # Always allow "no"
+            if value in ("n", "no"):
+                return False
+            raise InvalidResponse(self.validate_error_message)
+
+    return Confirm
+
+
+def __getattr__(name):
+    if name == "Confirm":
+        return _get_confirm_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
-import re
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1024)
 def camel_to_underscore(name):
     """Convert camel case name to underscore name.
 
@@ -34,12 +35,29 @@ def camel_to_underscore(name):
         '_request'
         >>> camel_to_underscore('Request_')
         'request_'
+        >>> camel_to_underscore('HTTP2Request')
+        'http2_request'
+        >>> camel_to_underscore('Big2SATTestCase')
+        'big2sat_test_case'
 
     """
-    name = re.sub(r"(?<!\b)(?<!_)([A-Z][a-z])", r"_\1", name)
-    name = re.sub(r"(?<!\b)(?<!_)([a-z])([A-Z])", r"\1_\2", name)
-    name = name.lower()
-    return name
+    # An underscore is inserted before an upper case letter that starts
+    # a capitalized word (e.g., the R in HTTPRequest) or that follows
+    # a lower case letter (e.g., the R in httpRequest), except where
+    # it would follow an underscore or start a word. Only ASCII letters
+    # count as upper/lower case here.
+    n = len(name)
+    chars = []
+    append = chars.append
+    for i, c in enumerate(name):
+        if "A" <= c <= "Z" and i and name[i - 1].isalnum():
+            prev = name[i - 1]
+            if i + 1 < n and "a" <= name[i + 1] <= "z":
+                append("_")
+            elif "a" <= prev <= "z" and i > 1 and name[i - 2].isalnum():
+                append("_")
+        append(c)
+    return "".join(chars).lower()
 
 
 def invert_string(string):
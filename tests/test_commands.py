@@ -1,12 +1,13 @@
 import io
 import os
 import sys
+import tempfile
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from runcommands import arg, command, subcommand
-from runcommands.commands import local
+from runcommands.commands import local, sync
 from runcommands.exc import RunAborted
 from runcommands.result import Result
 from runcommands.run import run
@@ -98,6 +99,71 @@ class TestLocalCommand(TestCase):
         self.assertIn("__init__.py", result.stdout_lines)
         self.assertTrue(result)
 
+    def test_local_simple_string_runs_without_shell(self):
+        result = local("ls -1", cd=os.path.dirname(__file__), stdout="capture")
+        self.assertEqual(list(result.args), ["ls", "-1"])
+        self.assertIn("__init__.py", result.stdout_lines)
+
+    def test_local_string_with_shell_syntax_runs_in_shell(self):
+        result = local("echo $HOME | cat", stdout="capture")
+        self.assertEqual(result.stdout.strip(), os.environ["HOME"])
+
+    def test_local_simple_string_missing_command(self):
+        result = local(
+            "runcommands-missing-command", stderr="hide", raise_on_error=False
+        )
+        self.assertEqual(result.return_code, 127)
+        with self.assertRaises(Result) as context:
+            local("runcommands-missing-command", stderr="hide")
+        self.assertEqual(context.exception.return_code, 127)
+
+    def test_local_simple_string_script_without_shebang(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "script.sh")
+            with open(path, "w") as fp:
+                fp.write("echo no shebang\n")
+            os.chmod(path, 0o755)
+            result = local("./script.sh", cd=temp_dir, stdout="capture")
+        self.assertEqual(result.stdout, "no shebang\n")
+
+
+class TestResult(TestCase):
+    def test_output_lines(self):
+        result = Result(["cmd"], 0, "a\nb\n", "c\r\nd\x0ce\u2028f")
+        self.assertEqual(result.stdout_lines, ["a", "b"])
+        self.assertEqual(result.stderr_lines, ["c", "d", "e", "f"])
+        self.assertIsInstance(result.stdout_lines, list)
+        self.assertEqual(result.stdout_lines + ["x"], ["a", "b", "x"])
+
+    def test_output_lines_without_output(self):
+        result = Result(["cmd"], 0, None, "")
+        self.assertEqual(result.stdout_lines, [])
+        self.assertEqual(result.stderr_lines, [])
+
+
+class TestSyncCommand(TestCase):
+    def _get_args(self, **kwargs):
+        module = sys.modules["runcommands.commands.sync"]
+        with mock.patch.object(module, "_run_subprocess") as run_subprocess:
+            sync("/src/", "/dest/", "host", mode=None, quiet=False, **kwargs)
+        return run_subprocess.call_args[0][0]
+
+    def test_default_options(self):
+        args = self._get_args()
+        self.assertEqual(args[:4], ["rsync", "-rltvz", "--no-perms", "--no-group"])
+
+    def test_string_option(self):
+        args = self._get_args(options="-a")
+        self.assertEqual(args, ["rsync", "-a", "/src/", "host:/dest/"])
+
+    def test_nested_and_empty_options(self):
+        options = ["-a", "", None, (), [], ("--no-perms", ["--max-size", 10])]
+        args = self._get_args(options=options)
+        self.assertEqual(
+            args,
+            ["rsync", "-a", "--no-perms", "--max-size", "10", "/src/", "host:/dest/"],
+        )
+
 
 class TestCommandWithContainerArgs(SysExitMixin, TestCase):
     def test_positional(self):
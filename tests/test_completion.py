@@ -0,0 +1,76 @@
+import os
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import TestCase
+
+from runcommands.completion import complete
+from runcommands.run import run
+
+
+COMMANDS_MODULE = """\
+from runcommands import command
+
+
+@command
+def build_it(target=None, verbose=False):
+    pass
+"""
+
+
+class TestCompletion(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.commands_file = os.path.join(self.temp_dir.name, "commands.py")
+        with open(self.commands_file, "w") as fp:
+            fp.write(COMMANDS_MODULE)
+        self.original_cache_home = os.environ.get("XDG_CACHE_HOME")
+        os.environ["XDG_CACHE_HOME"] = os.path.join(self.temp_dir.name, "cache")
+
+    def tearDown(self):
+        if self.original_cache_home is None:
+            del os.environ["XDG_CACHE_HOME"]
+        else:
+            os.environ["XDG_CACHE_HOME"] = self.original_cache_home
+        self.temp_dir.cleanup()
+
+    def _complete(self, command_line, current_token, shell="bash"):
+        stdout = StringIO()
+        with redirect_stdout(stdout):
+            complete(command_line, current_token, len(command_line), shell)
+        return stdout.getvalue().splitlines()
+
+    def test_complete_command_names(self):
+        command_line = f"run -m {self.commands_file} it"
+        # bash only gets names matching the prefix; fish gets all names
+        # so it can do its own fuzzy matching.
+        self.assertEqual(self._complete(command_line, "it"), [])
+        self.assertEqual(self._complete(command_line, "it", "fish"), ["build-it\t"])
+
+    def test_complete_command_options_with_and_without_cache(self):
+        command_line = f"run -m {self.commands_file} build_it --"
+        # The first completion populates the cache; the second uses it.
+        uncached = self._complete(command_line, "--")
+        cached = self._complete(command_line, "--")
+        self.assertEqual(uncached, ["--help", "--no-verbose", "--target", "--verbose"])
+        self.assertEqual(cached, uncached)
+
+
+class TestGetCommandsModuleOption(TestCase):
+    def test_forms(self):
+        cases = [
+            ([], None),
+            (["-e", "prod"], None),
+            (["-m", "foo.py"], "foo.py"),
+            (["-mfoo.py"], "foo.py"),
+            (["-m=foo.py"], "foo.py"),
+            (["--commands-module", "foo.py"], "foo.py"),
+            (["--commands-module=foo.py"], "foo.py"),
+            (["-e", "prod", "-m", "foo.py"], "foo.py"),
+            (["-m", "foo.py", "-m", "bar.py"], "bar.py"),
+            (["-dmfoo.py"], "foo.py"),
+            (["-d", "-mfoo.py"], "foo.py"),
+        ]
+        for run_argv, expected in cases:
+            with self.subTest(run_argv=run_argv):
+                self.assertEqual(run.get_commands_module_option(run_argv), expected)
@@ -3,6 +3,7 @@ from unittest import TestCase
 
 from runcommands.collection import Collection
 from runcommands.command import command
+from runcommands.exc import RunnerError
 from runcommands.run import run
 from runcommands.runner import CommandRunner
 
@@ -68,3 +69,32 @@ class TestConfig(TestCase):
         # Uses no default args
         result = runner.run(["test", "--a", "x", "--b", "y", "c", "-d", "z"])[0]
         self.assertEqual(("x", "y", "c", "z"), result)
+
+    def test_interpolate_multiple_groups(self):
+        config = self.interpolate({"globals": {"x": "X", "y": "{{ x }}-{{x}}/{{ x }}"}})
+        self.assertEqual("X-X/X", config["globals"]["y"])
+
+    def test_interpolate_escaped_group(self):
+        config = self.interpolate({"globals": {"x": "X", "y": "\\{{ x }} {{ x }}"}})
+        self.assertEqual("\\{{ x }} X", config["globals"]["y"])
+
+    def test_interpolate_dotted_key(self):
+        config = self.interpolate(
+            {"globals": {"db": {"host": "localhost"}, "url": "db://{{ db.host }}"}}
+        )
+        self.assertEqual("db://localhost", config["globals"]["url"])
+
+    def test_interpolate_whole_value_keeps_type(self):
+        config = self.interpolate(
+            {
+                "globals": {"n": 1, "items": ["a", "b"]},
+                "args": {
+                    "test": {"a": "{{ n }}", "b": "{{ items }}", "c": "n={{ n }}"}
+                },
+            }
+        )
+        self.assertEqual({"a": 1, "b": ["a", "b"], "c": "n=1"}, config["args"]["test"])
+
+    def test_interpolate_circular_reference(self):
+        with self.assertRaises(RunnerError):
+            self.interpolate({"globals": {"a": "{{ b }}", "b": "{{ a }}"}})
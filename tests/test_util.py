@@ -1,13 +1,18 @@
+import copy
+import pickle
 from contextlib import redirect_stderr, redirect_stdout
 from doctest import DocTestSuite
 from io import StringIO
 from unittest import TestCase
 
+from rich.console import Console
+
 import runcommands.util.misc
 import runcommands.util.path
 import runcommands.util.string
 
-from runcommands.util.printer import printer
+from runcommands.util.data import Data
+from runcommands.util.printer import Printer, printer
 
 
 def load_tests(loader, tests, ignore):
@@ -47,3 +52,53 @@ class TestPrinter(TestCase):
         with redirect_stdout(stdout):
             printer.print()
         self.assertEqual(stdout.getvalue(), "\n")
+
+    def test_style_methods(self):
+        test_printer = Printer()
+        stdout = StringIO()
+        with redirect_stdout(stdout):
+            test_printer.red("red")
+            test_printer.bold("bold")
+        self.assertEqual(stdout.getvalue(), "red\nbold\n")
+
+    def test_style_methods_use_current_console(self):
+        test_printer = Printer()
+        with redirect_stdout(StringIO()):
+            test_printer.red("before")
+        file = StringIO()
+        test_printer.stdout_console = Console(file=file)
+        test_printer.red("after")
+        self.assertEqual(file.getvalue(), "after\n")
+
+    def test_unknown_attribute(self):
+        test_printer = Printer()
+        for name in ("not_a_style", "__deepcopy__", "_private"):
+            with self.subTest(name=name):
+                self.assertFalse(hasattr(test_printer, name))
+                self.assertNotIn(name, vars(test_printer))
+
+
+class TestData(TestCase):
+    def test_missing_attribute(self):
+        data = Data(a=1)
+        self.assertFalse(hasattr(data, "b"))
+        self.assertRaises(AttributeError, getattr, data, "b")
+        self.assertRaises(KeyError, data.__getitem__, "b")
+
+    def test_copy(self):
+        data = Data(a=1, b={"c": 2})
+        data_copy = copy.copy(data)
+        self.assertEqual(data_copy.a, 1)
+        self.assertIs(data_copy.b, data.b)
+
+    def test_deepcopy(self):
+        data = Data(a=1, b={"c": 2})
+        data_copy = copy.deepcopy(data)
+        self.assertEqual(data_copy.b.c, 2)
+        self.assertIsNot(data_copy.b, data.b)
+
+    def test_pickle(self):
+        data = Data(a=1, b={"c": 2})
+        data_copy = pickle.loads(pickle.dumps(data))
+        self.assertEqual(data_copy.a, 1)
+        self.assertEqual(data_copy["b"]["c"], 2)